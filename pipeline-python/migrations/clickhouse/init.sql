@@ -11,12 +11,16 @@ CREATE DATABASE IF NOT EXISTS jackfruit;
 -- ReplacingMergeTree(inserted_at) deduplicates rows with the same sorting key
 -- during background merges, keeping the row with the highest inserted_at.
 -- Queries must use FINAL to see deduplicated results.
+--
+-- Codecs: lat/lon are sorted/arithmetic within a part and values are spatially
+-- smooth, so Gorilla (XOR of neighbouring floats) + ZSTD compresses them far
+-- better than the default LZ4 alone; timestamp changes in fixed steps (DoubleDelta).
 CREATE TABLE IF NOT EXISTS jackfruit.grid_data (
     variable     LowCardinality(String),
-    timestamp    DateTime,
-    lat          Float32,
-    lon          Float32,
-    value        Float32,
+    timestamp    DateTime CODEC(DoubleDelta, LZ4),
+    lat          Float32 CODEC(Gorilla, ZSTD(1)),
+    lon          Float32 CODEC(Gorilla, ZSTD(1)),
+    value        Float32 CODEC(Gorilla, ZSTD(1)),
     unit         LowCardinality(String),
     catalog_id   UUID,
     inserted_at  DateTime64(3) DEFAULT now64(3)
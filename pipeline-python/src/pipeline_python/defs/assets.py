@@ -5,10 +5,8 @@ Ingestion fetches raw GRIB data from external APIs (Copernicus ADS via cdsapi,
 ECMWF Open Data) and stores it in MinIO. Transformation decodes the GRIB,
 extracts grids, and writes curated rows to ClickHouse.
 """
-import tempfile
 import uuid
 from datetime import date, datetime
-from pathlib import Path
 from uuid import UUID
 
 import dagster as dg
@@ -70,6 +68,40 @@ def _clip_to_europe(
     )
 
 
+class _GridBatch:
+    """Buffers grids and their lineage records, flushing both within grid_store.insert_batch_rows.
+
+    Each flush writes the batch's curated_data records before its ClickHouse rows, so
+    every grid visible in ClickHouse already has lineage — also when a later batch fails.
+    Keeps only one batch of decoded grids in memory instead of a whole raw file.
+    A grid larger than the budget on its own is flushed alone.
+    """
+
+    def __init__(self, grid_store: GridStore, catalog: PostgresCatalogResource):
+        self._grid_store = grid_store
+        self._catalog = catalog
+        self._grids: list[GridData] = []
+        self._records: list[CuratedDataRecord] = []
+        self._rows = 0
+        self.rows_inserted = 0
+
+    def add(self, grid: GridData, record: CuratedDataRecord) -> None:
+        if self._grids and self._rows + grid.row_count > self._grid_store.insert_batch_rows:
+            self.flush()
+        self._grids.append(grid)
+        self._records.append(record)
+        self._rows += grid.row_count
+
+    def flush(self) -> None:
+        if not self._grids:
+            return
+        self._catalog.insert_curated_records(self._records)
+        self.rows_inserted += self._grid_store.insert_grids(self._grids)
+        self._grids = []
+        self._records = []
+        self._rows = 0
+
+
 class CamsForecastConfig(dg.Config):
     """Configuration for the ingestion asset."""
     horizon_hours: int = 48
@@ -107,8 +139,8 @@ def ingest_cams_data(
 
     context.log.info(f"Starting ingestion: source={_ADS_SOURCE}, dataset={_AIR_QUALITY_FORECAST}, date={partition_date}, run_id={run_id}")
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir) / "cams.grib"
+    s3_key = f"{_ADS_SOURCE}/{_AIR_QUALITY_FORECAST}/{partition_date}/{run_id}.grib"
+    with object_store.scoped_tempfile(s3_key) as tmp_path:
         cds_client.retrieve_forecast(
             forecast_date=partition_date,
             variables=["pm2p5", "pm10"],
@@ -116,7 +148,6 @@ def ingest_cams_data(
             max_leadtime_hours=config.horizon_hours,
         )
         context.log.info(f"Downloaded CAMS data ({tmp_path.stat().st_size} bytes)")
-        s3_key = f"{_ADS_SOURCE}/{_AIR_QUALITY_FORECAST}/{partition_date}/{run_id}.grib"
         object_store.upload_raw(s3_key, tmp_path)
         context.log.info(f"Uploaded to {s3_key}")
 
@@ -155,8 +186,9 @@ def transform_cams_data(
     Transform raw CAMS GRIB data into curated grid rows in ClickHouse.
 
     Reads upstream ingestion metadata to locate the raw file, downloads it from MinIO,
-    extracts grid data per GRIB message, inserts rows into ClickHouse, and records
-    lineage in the Postgres catalog.
+    extracts grid data per GRIB message, and writes it in batches bounded by
+    grid_store.insert_batch_rows — each batch's lineage to the Postgres catalog first,
+    then its grid rows to ClickHouse.
 
     Args:
         context: Dagster execution context (provides partition key and upstream metadata)
@@ -192,10 +224,8 @@ def transform_cams_data(
     context.log.info(f"Processing {raw_key}")
     curated_keys: list[UUID] = []
     variables_processed: list[str] = []
-    rows_inserted: int = 0
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_dir = Path(tmp_dir)
-        tmp_raw_path = tmp_dir / "raw.grib"
+    batch = _GridBatch(grid_store, catalog)
+    with object_store.scoped_tempfile(raw_key) as tmp_raw_path:
         try:
             object_store.download_raw(raw_key, tmp_raw_path)
         except Exception as e:
@@ -209,7 +239,7 @@ def transform_cams_data(
                 if unit == "kg m-3":
                     values = values * 1e9
                     unit = "µg/m³"
-                rows_inserted += grid_store.insert_grid(GridData(
+                batch.add(GridData(
                     variable=message.variable_name,
                     unit=unit,
                     timestamp=message.timestamp,
@@ -217,8 +247,7 @@ def transform_cams_data(
                     lons=message.lons,
                     values=values,
                     catalog_id=catalog_id,
-                ))
-                catalog.insert_curated_data(CuratedDataRecord(
+                ), CuratedDataRecord(
                     id=catalog_id,
                     raw_file_id=uuid.UUID(run_id),
                     variable=message.variable_name,
@@ -228,6 +257,9 @@ def transform_cams_data(
                 curated_keys.append(catalog_id)
                 variables_processed.append(message.variable_name)
 
+    batch.flush()
+    rows_inserted = batch.rows_inserted
+
     return dg.MaterializeResult(
         metadata={
             "run_id": run_id,
@@ -265,8 +297,8 @@ def ingest_ecmwf_data(
     partition_date = date.fromisoformat(context.partition_key)
     context.log.info(f"Starting ingestion: source={_ECMWF_SOURCE}, dataset={_WEATHER_FORECAST}, date={partition_date}, run_id={run_id}")
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir) / "ecmwf.grib"
+    s3_key = f"{_ECMWF_SOURCE}/{_WEATHER_FORECAST}/{partition_date}/{run_id}.grib"
+    with object_store.scoped_tempfile(s3_key) as tmp_path:
         ecmwf_client.retrieve_forecast(
             forecast_date=partition_date,
             variables=["temperature", "dewpoint"],
@@ -274,7 +306,6 @@ def ingest_ecmwf_data(
             max_leadtime_hours=config.horizon_hours,
         )
         context.log.info(f"Downloaded ECMWF data ({tmp_path.stat().st_size} bytes)")
-        s3_key = f"{_ECMWF_SOURCE}/{_WEATHER_FORECAST}/{partition_date}/{run_id}.grib"
         object_store.upload_raw(s3_key, tmp_path)
         context.log.info(f"Uploaded to {s3_key}")
 
@@ -316,7 +347,8 @@ def transform_ecmwf_data(
     Reads upstream ingestion metadata to locate the raw file, downloads it from MinIO,
     groups messages by timestamp, converts temperature from Kelvin to Celsius, computes
     relative humidity from dewpoint via the Magnus formula, clips to the European bounding
-    box, inserts rows into ClickHouse, and records lineage in the Postgres catalog.
+    box, and writes it in bounded batches — each batch's lineage to the Postgres catalog
+    first, then its grid rows to ClickHouse.
 
     Args:
         context: Dagster execution context (provides partition key and upstream metadata)
@@ -350,10 +382,9 @@ def transform_ecmwf_data(
 
     curated_keys: list[uuid.UUID] = []
     variables_processed: list[str] = []
-    rows_inserted = 0
+    batch = _GridBatch(grid_store, catalog)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir) / "raw.grib"
+    with object_store.scoped_tempfile(raw_key) as tmp_path:
         try:
             object_store.download_raw(raw_key, tmp_path)
         except Exception as e:
@@ -388,12 +419,11 @@ def transform_ecmwf_data(
                          / np.exp(17.625 * t_c / (243.04 + t_c))
 
                 catalog_id_t = uuid.uuid7()
-                rows_inserted += grid_store.insert_grid(GridData(
+                batch.add(GridData(
                     variable="temperature", unit="°C", timestamp=ts,
                     lats=t_lats, lons=t_lons, values=t_c,
                     catalog_id=catalog_id_t,
-                ))
-                catalog.insert_curated_data(CuratedDataRecord(
+                ), CuratedDataRecord(
                     id=catalog_id_t, raw_file_id=uuid.UUID(run_id),
                     variable="temperature", unit="°C", timestamp=ts,
                 ))
@@ -401,12 +431,11 @@ def transform_ecmwf_data(
                 variables_processed.append("temperature")
 
                 catalog_id_d = uuid.uuid7()
-                rows_inserted += grid_store.insert_grid(GridData(
+                batch.add(GridData(
                     variable="dewpoint", unit="°C", timestamp=ts,
                     lats=d_lats, lons=d_lons, values=d_c,
                     catalog_id=catalog_id_d,
-                ))
-                catalog.insert_curated_data(CuratedDataRecord(
+                ), CuratedDataRecord(
                     id=catalog_id_d, raw_file_id=uuid.UUID(run_id),
                     variable="dewpoint", unit="°C", timestamp=ts,
                 ))
@@ -414,18 +443,20 @@ def transform_ecmwf_data(
                 variables_processed.append("dewpoint")
 
                 catalog_id_h = uuid.uuid7()
-                rows_inserted += grid_store.insert_grid(GridData(
+                batch.add(GridData(
                     variable="humidity", unit="%", timestamp=ts,
                     lats=t_lats, lons=t_lons, values=rh,
                     catalog_id=catalog_id_h,
-                ))
-                catalog.insert_curated_data(CuratedDataRecord(
+                ), CuratedDataRecord(
                     id=catalog_id_h, raw_file_id=uuid.UUID(run_id),
                     variable="humidity", unit="%", timestamp=ts,
                 ))
                 curated_keys.append(catalog_id_h)
                 variables_processed.append("humidity")
 
+    batch.flush()
+    rows_inserted = batch.rows_inserted
+
     return dg.MaterializeResult(metadata={
         "run_id": run_id,
         "date": partition_date,
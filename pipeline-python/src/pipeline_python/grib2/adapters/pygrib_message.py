@@ -0,0 +1,53 @@
+# grib2/adapters/pygrib_message.py
+from datetime import datetime
+
+import numpy as np
+import pygrib
+
+
+class CoordinateCache:
+    """Float32 lat/lon arrays per grid geometry, shared (read-only) by all messages of one open file."""
+
+    def __init__(self):
+        self._coords: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    def get(self, message: pygrib.gribmessage) -> tuple[np.ndarray, np.ndarray]:
+        """Return the message's lat/lon arrays, calling latlons() once per md5GridSection."""
+        key = message.md5GridSection
+        if key not in self._coords:
+            lats, lons = (np.ascontiguousarray(a, dtype=np.float32) for a in message.latlons())
+            lats.flags.writeable = False
+            lons.flags.writeable = False
+            self._coords[key] = (lats, lons)
+        return self._coords[key]
+
+
+class PygribMessage:
+    """Source-independent part of a pygrib-backed GribMessage; subclasses map variable_name."""
+
+    def __init__(self, message: pygrib.gribmessage, coords: CoordinateCache):
+        self._message = message
+        self._coords = coords
+        self._values: np.ndarray | None = None
+
+    @property
+    def unit(self) -> str:
+        return self._message.parameterUnits
+
+    @property
+    def timestamp(self) -> datetime:
+        return self._message.validDate
+
+    @property
+    def values(self) -> np.ndarray:
+        if self._values is None:
+            self._values = self._message.values
+        return self._values
+
+    @property
+    def lats(self) -> np.ndarray:
+        return self._coords.get(self._message)[0]
+
+    @property
+    def lons(self) -> np.ndarray:
+        return self._coords.get(self._message)[1]
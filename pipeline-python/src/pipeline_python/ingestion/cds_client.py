@@ -3,6 +3,7 @@ from pathlib import Path
 
 import cdsapi
 import dagster as dg
+from pydantic import PrivateAttr
 
 _CDS_API_DATASET = "cams-europe-air-quality-forecasts"
 
@@ -21,6 +22,7 @@ class CdsClient(dg.ConfigurableResource):
 
     Wraps the cdsapi library as a Dagster ConfigurableResource.
     Credentials are passed explicitly (not via ~/.cdsapirc) for production use.
+    The underlying cdsapi client is created lazily and reused across retrievals.
 
     Attributes:
         url: ADS API base URL (e.g., 'https://ads.atmosphere.copernicus.eu/api')
@@ -29,6 +31,12 @@ class CdsClient(dg.ConfigurableResource):
 
     url: str
     api_key: str
+    _client: cdsapi.Client | None = PrivateAttr(default=None)
+
+    def _get_client(self) -> cdsapi.Client:
+        if self._client is None:
+            self._client = cdsapi.Client(url=self.url, key=self.api_key, quiet=True)
+        return self._client
 
     def retrieve_forecast(
             self,
@@ -75,5 +83,4 @@ class CdsClient(dg.ConfigurableResource):
             "data_format": "grib",
         }
 
-        client = cdsapi.Client(url=self.url, key=self.api_key, quiet=True)
-        client.retrieve(_CDS_API_DATASET, request).download(str(target))
+        self._get_client().retrieve(_CDS_API_DATASET, request).download(str(target))
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import dagster as dg
 from ecmwf.opendata import Client
+from pydantic import PrivateAttr
 
 _MAX_LEADTIME = 48
 _ECMWF_STEPS = list(range(0, _MAX_LEADTIME + 1, 3))
@@ -16,11 +17,19 @@ class EcmwfClient(dg.ConfigurableResource):
     """
     ECMWF Open Data client for downloading global IFS forecast GRIB data.
 
+    The underlying opendata client is created lazily and reused across retrievals.
+
     Attributes:
         source: ECMWF data source ("ecmwf" or any available mirror)
     """
 
     source: str
+    _client: Client | None = PrivateAttr(default=None)
+
+    def _get_client(self) -> Client:
+        if self._client is None:
+            self._client = Client(source=self.source)
+        return self._client
 
     def retrieve_forecast(
         self,
@@ -38,7 +47,6 @@ class EcmwfClient(dg.ConfigurableResource):
                 f"ECMWF forecast minimum is 0 hours, got {max_leadtime_hours}"
             )
 
-        client = Client(source=self.source)
         api_variables = [_VARIABLE_MAP[v] for v in variables]
         request = {
             "date": forecast_date,
@@ -49,4 +57,4 @@ class EcmwfClient(dg.ConfigurableResource):
             "step": [x for x in _ECMWF_STEPS if x <= max_leadtime_hours],
             "param": api_variables,
         }
-        client.retrieve(request, str(target))
+        self._get_client().retrieve(request, str(target))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterable
 from uuid import UUID
 
 import dagster as dg
@@ -8,17 +9,22 @@ from abc import abstractmethod, ABC
 import numpy as np
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
 class GridData:
     """
     Extracted grid data ready for ClickHouse insertion.
 
-    All arrays are 2D of the same shape (M, K) — one element per grid point.
+    All arrays are 2D of the same shape (M, K) — one element per grid point —
+    and are coerced to C-contiguous float32 on construction (no copy when they
+    already are), matching the Float32 CH columns.
     Flattening to 1D happens in the storage layer.
     Units are source-dependent; conversion (if any) happens during extraction.
 
     Fields align with CH jackfruit.grid_data columns:
     (variable, timestamp, lat, lon, value, unit, catalog_id)
+
+    Slotted (no per-instance __dict__) and compared by identity — field-wise
+    equality over ndarrays is ambiguous anyway.
     """
 
     variable: str
@@ -30,9 +36,12 @@ class GridData:
     catalog_id: UUID
 
     def __post_init__(self) -> None:
-        if self.values.ndim != 2:
-            raise ValueError(f"values must be 2-dimensional, got shape {self.values.shape}")
-        if not (self.lats.shape == self.lons.shape == self.values.shape):
+        for name in ("lats", "lons", "values"):
+            object.__setattr__(self, name, np.ascontiguousarray(getattr(self, name), dtype=np.float32))
+        shape = self.values.shape
+        if len(shape) != 2:
+            raise ValueError(f"values must be 2-dimensional, got shape {shape}")
+        if self.lats.shape != shape or self.lons.shape != shape:
             raise ValueError(
                 f"All arrays must have the same shape, "
                 f"got lats={self.lats.shape}, lons={self.lons.shape}, values={self.values.shape}"
@@ -48,10 +57,18 @@ class GridStore(dg.ConfigurableResource, ABC):
     """
     Abstract base class for grid data storage backends.
 
-    Subclasses must implement insert_grid(). Extends ConfigurableResource so Dagster
-    manages lifecycle (config injection, teardown).
+    Subclasses must implement insert_grid(); insert_grids() defaults to one
+    insert_grid() call per grid and can be overridden to batch writes.
+    Extends ConfigurableResource so Dagster manages lifecycle (config injection, teardown).
+
+    Attributes:
+        insert_batch_rows: Row budget per insert_grids() call. Callers buffer grids and
+            flush once the next grid would exceed it, so peak memory stays bounded
+            regardless of how many grids a raw file holds (default: 1,000,000).
     """
 
+    insert_batch_rows: int = 1_000_000
+
     @abstractmethod
     def insert_grid(self, grid: GridData) -> int:
         """
@@ -65,6 +82,18 @@ class GridStore(dg.ConfigurableResource, ABC):
         """
         ...
 
+    def insert_grids(self, grids: Iterable[GridData]) -> int:
+        """
+        Insert several grids into storage.
+
+        Args:
+            grids: Extracted grid data, typically all grids decoded from one raw file
+
+        Returns:
+            Number of rows inserted
+        """
+        return sum(self.insert_grid(grid) for grid in grids)
+
     def compact(self) -> None:
         """Post-write maintenance hook — run compaction/dedup if the backend needs it."""
         pass
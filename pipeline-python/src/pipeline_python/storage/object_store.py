@@ -1,8 +1,15 @@
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator
 
 import boto3
 import dagster as dg
+from botocore.client import BaseClient
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from pydantic import PrivateAttr
 
 
 class ObjectStore(dg.ConfigurableResource):
@@ -11,6 +18,7 @@ class ObjectStore(dg.ConfigurableResource):
 
     Provides explicit download/upload methods optimized for large files.
     Uses boto3 with local temp files (current GRIB readers, e.g. pygrib via GribReader, require local file access).
+    The boto3 client is created lazily and reused across calls.
 
     Attributes:
         endpoint_url: S3/MinIO endpoint URL (e.g., 'http://minio:9000')
@@ -18,13 +26,16 @@ class ObjectStore(dg.ConfigurableResource):
         secret_key: S3/MinIO secret key (sourced from environment variable)
         raw_bucket: Name of the raw data bucket (default: 'jackfruit-raw')
         use_ssl: Whether to use SSL for connections (default: False)
+        scratch_dir: Local directory for transient copies of raw files (default: '/tmp/jackfruit-scratch')
+        max_pool_connections: Size of the client's HTTP connection pool (default: 10, botocore's default).
+            Multipart transfers use up to 10 threads each; raise this if transfers run concurrently.
 
     Example usage in an asset:
         @dg.asset
         def my_asset(storage: ObjectStore):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_path = Path(tmpdir) / "raw.grib"
-                storage.download_raw("ads/cams/.../file.grib", local_path)
+            key = "ads/cams/.../file.grib"
+            with storage.scoped_tempfile(key) as local_path:
+                storage.download_raw(key, local_path)
                 # ... process ...
     """
 
@@ -33,16 +44,51 @@ class ObjectStore(dg.ConfigurableResource):
     secret_key: str
     raw_bucket: str
     use_ssl: bool
+    scratch_dir: str = "/tmp/jackfruit-scratch"
+    max_pool_connections: int = 10
+    _client: BaseClient | None = PrivateAttr(default=None)
+
+    def _get_client(self) -> BaseClient:
+        """Return the boto3 S3 client configured for MinIO/S3, creating it on first use."""
+        if self._client is None:
+            self._client = boto3.client(
+                "s3",
+                endpoint_url=self.endpoint_url,
+                aws_access_key_id=self.access_key,
+                aws_secret_access_key=self.secret_key,
+                use_ssl=self.use_ssl,
+                config=Config(max_pool_connections=self.max_pool_connections),
+            )
+        return self._client
+
+    @contextmanager
+    def scoped_tempfile(self, key: str) -> Iterator[Path]:
+        """
+        Yield a unique local path for an object key, removed on exit.
+
+        Files go straight into the flat scratch_dir, named after the key's file name
+        plus a random part, so concurrent runs handling the same key never share a file
+        and no per-partition directories are left behind.
+
+        Args:
+            key: S3 key the local file corresponds to
 
-    def _get_client(self):
-        """Create boto3 S3 client configured for MinIO/S3."""
-        return boto3.client(
-            "s3",
-            endpoint_url=self.endpoint_url,
-            aws_access_key_id=self.access_key,
-            aws_secret_access_key=self.secret_key,
-            use_ssl=self.use_ssl,
-        )
+        Raises:
+            ValueError: If key is empty or contains only whitespace.
+        """
+        if not key or not key.strip():
+            raise ValueError("S3 key cannot be empty")
+
+        scratch_dir = Path(self.scratch_dir)
+        scratch_dir.mkdir(parents=True, exist_ok=True)
+        key_path = Path(key)
+        fd, path = tempfile.mkstemp(dir=scratch_dir, prefix=f"{key_path.stem}.", suffix=key_path.suffix)
+        os.close(fd)
+        local_path = Path(path)
+        try:
+            yield local_path
+        finally:
+            local_path.unlink(missing_ok=True)
 
     def download_raw(self, key: str, local_path: Path) -> None:
         """
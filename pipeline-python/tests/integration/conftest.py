@@ -6,8 +6,12 @@ Auto-marks tests in this directory as 'integration'
 
 Uses production databases/schemas (created by docker-compose init scripts).
 Tables are truncated before each test — no separate test namespaces.
+Session fixtures probe each service first and skip when it isn't listening,
+so a plain `pytest` without Docker skips fast instead of waiting on TCP timeouts.
 """
 import os
+import socket
+from urllib.parse import urlparse
 
 import boto3
 import clickhouse_connect
@@ -30,6 +34,14 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(pytest.mark.integration)
 
 
+def _skip_unless_reachable(service: str, host: str, port: int) -> None:
+    """Skip the requesting fixture's tests if nothing accepts TCP connections on host:port."""
+    try:
+        socket.create_connection((host, port), timeout=0.5).close()
+    except OSError:
+        pytest.skip(f"{service} not reachable at {host}:{port}")
+
+
 # ---------------------------------------------------------------------------
 # Session-scoped infrastructure fixtures
 # ---------------------------------------------------------------------------
@@ -37,6 +49,7 @@ def pytest_collection_modifyitems(config, items):
 @pytest.fixture(scope="session")
 def ch_client():
     """Session-scoped ClickHouse connection for cleanup."""
+    _skip_unless_reachable("ClickHouse", os.environ["CLICKHOUSE_HOST"], int(os.environ["CLICKHOUSE_PORT"]))
     client = clickhouse_connect.get_client(
         host=os.environ["CLICKHOUSE_HOST"],
         username=os.environ["CLICKHOUSE_USER"],
@@ -50,12 +63,13 @@ def ch_client():
 
 @pytest.fixture(scope="session")
 def pg_connection():
-    """Session-scoped Postgres connection for cleanup."""
+    """Session-scoped autocommit Postgres connection for cleanup and assertions."""
+    _skip_unless_reachable("Postgres", os.environ["POSTGRES_HOST"], int(os.environ["POSTGRES_PORT"]))
     dsn = (
         f"postgresql://{os.environ['POSTGRES_USER']}:{os.environ['POSTGRES_PASSWORD']}"
         f"@{os.environ['POSTGRES_HOST']}:{os.environ['POSTGRES_PORT']}/{os.environ['POSTGRES_DB']}"
     )
-    conn = psycopg.connect(dsn)
+    conn = psycopg.connect(dsn, autocommit=True)
     yield conn
     conn.close()
 
@@ -63,6 +77,8 @@ def pg_connection():
 @pytest.fixture(scope="session")
 def s3_client():
     """Session-scoped MinIO/S3 client for cleanup."""
+    endpoint = urlparse(os.environ["MINIO_ENDPOINT_URL"])
+    _skip_unless_reachable("MinIO", endpoint.hostname, endpoint.port or (443 if endpoint.scheme == "https" else 80))
     client = boto3.client(
         "s3",
         endpoint_url=os.environ["MINIO_ENDPOINT_URL"],
@@ -79,26 +95,27 @@ def s3_client():
 
 @pytest.fixture(autouse=True)
 def clean_ch(ch_client):
-    """Truncate CH grid_data before each test."""
-    ch_client.command("TRUNCATE TABLE grid_data")
+    """Truncate CH grid_data before each test (skipped when already empty)."""
+    if ch_client.command("SELECT count() FROM grid_data"):
+        ch_client.command("TRUNCATE TABLE grid_data")
     yield
 
 
 @pytest.fixture(autouse=True)
 def clean_pg(pg_connection):
-    """Truncate Postgres catalog tables before each test."""
+    """Truncate Postgres catalog tables before each test (single autocommit round trip)."""
     pg_connection.execute("TRUNCATE catalog.curated_data, catalog.raw_files CASCADE")
-    pg_connection.commit()
     yield
 
 
 @pytest.fixture(autouse=True)
 def clean_minio(s3_client):
-    """Empty MinIO raw bucket before each test."""
+    """Empty MinIO raw bucket before each test — one batched delete per listed page (≤1000 keys)."""
     bucket = os.environ["MINIO_RAW_BUCKET"]
-    resp = s3_client.list_objects_v2(Bucket=bucket)
-    for obj in resp.get("Contents", []):
-        s3_client.delete_object(Bucket=bucket, Key=obj["Key"])
+    for page in s3_client.get_paginator("list_objects_v2").paginate(Bucket=bucket):
+        objects = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+        if objects:
+            s3_client.delete_objects(Bucket=bucket, Delete={"Objects": objects, "Quiet": True})
     yield
 
 
@@ -5,3 +5,20 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "unit" in str(item.fspath):
             item.add_marker(pytest.mark.unit)
+
+
+@pytest.fixture(scope="session")
+def object_store_settings(tmp_path_factory) -> dict[str, object]:
+    """Config for ObjectStore test doubles: dummy endpoint/credentials and a throwaway scratch_dir.
+
+    Doubles subclass ObjectStore and override only the S3 transfers, so assets
+    exercise the real scoped_tempfile.
+    """
+    return dict(
+        endpoint_url="http://localhost:9000",
+        access_key="test-access-key",
+        secret_key="test-secret-key",
+        raw_bucket="test-raw",
+        use_ssl=False,
+        scratch_dir=str(tmp_path_factory.mktemp("scratch")),
+    )
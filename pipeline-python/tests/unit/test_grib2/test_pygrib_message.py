@@ -0,0 +1,51 @@
+"""Tests for the shared pygrib adapter base (coordinate cache and message properties)."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+
+from pipeline_python.grib2.adapters.cams_adapter import CamsReader
+from pipeline_python.grib2.adapters.pygrib_message import CoordinateCache
+
+FIXTURE = Path(__file__).parent.parent.parent / "fixtures" / "019c7f73-419f-727c-8e56-95880501e36b.grib"
+
+
+def _mock_message(md5: str = "grid-a") -> Mock:
+    """A pygrib message stand-in exposing only what CoordinateCache reads."""
+    message = Mock(spec=["md5GridSection", "latlons"])
+    message.md5GridSection = md5
+    message.latlons.return_value = (np.zeros((2, 3)), np.ones((2, 3)))
+    return message
+
+
+class TestCoordinateCache:
+    """Tests for CoordinateCache.get()."""
+
+    def test_computes_coordinates_once_per_geometry(self):
+        cache = CoordinateCache()
+        first, second = _mock_message(), _mock_message()
+
+        assert cache.get(first) is cache.get(second)
+        first.latlons.assert_called_once()
+        second.latlons.assert_not_called()
+
+    def test_keeps_separate_coordinates_per_geometry(self):
+        cache = CoordinateCache()
+        assert cache.get(_mock_message("grid-a")) is not cache.get(_mock_message("grid-b"))
+
+    def test_coordinates_are_read_only_float32(self):
+        lats, lons = CoordinateCache().get(_mock_message())
+        for array in (lats, lons):
+            assert array.dtype == np.float32
+            assert not array.flags.writeable
+
+
+class TestPygribMessageCoordinates:
+    """Messages from one open file should share the cached coordinate arrays."""
+
+    def test_messages_share_coordinate_arrays(self):
+        with CamsReader().open(str(FIXTURE)) as messages:
+            first, second = list(messages)[:2]
+            assert first.lats is second.lats
+            assert first.lons is second.lons
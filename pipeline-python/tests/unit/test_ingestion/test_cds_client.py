@@ -71,6 +71,22 @@ class TestCdsClientRetrieveForecast:
             params = mock_client.retrieve.call_args[0][1]
             assert len(params["leadtime_hour"]) == 49  # 0..48 inclusive
 
+    def test_reuses_client_across_retrievals(self, cds_client, mock_cdsapi):
+        mock_module, mock_client, _ = mock_cdsapi
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a.grib", "b.grib"):
+                cds_client.retrieve_forecast(
+                    forecast_date=date.fromisoformat("2026-01-15"),
+                    variables=["pm2p5"],
+                    target=Path(tmpdir) / name,
+                )
+        mock_module.Client.assert_called_once_with(
+            url="https://ads.atmosphere.copernicus.eu/api",
+            key="test-key-123",
+            quiet=True,
+        )
+        assert mock_client.retrieve.call_count == 2
+
     def test_rejects_leadtime_above_48(self, cds_client):
         with pytest.raises(ValueError, match="48"):
             cds_client.retrieve_forecast(
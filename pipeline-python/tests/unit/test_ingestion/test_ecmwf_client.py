@@ -39,6 +39,19 @@ class TestEcmwfClientRetrieveForecast:
             )
         mock_client_cls.assert_called_once_with(source="azure")
 
+    def test_reuses_client_across_retrievals(self, ecmwf_client, mock_opendata):
+        """The opendata client should be created once and reused for later calls."""
+        mock_client_cls, mock_client_instance = mock_opendata
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("a.grib", "b.grib"):
+                ecmwf_client.retrieve_forecast(
+                    forecast_date=date(2026, 1, 15),
+                    variables=["temperature"],
+                    target=Path(tmpdir) / name,
+                )
+        mock_client_cls.assert_called_once_with(source="ecmwf")
+        assert mock_client_instance.retrieve.call_count == 2
+
     def test_retrieve_passes_correct_params(self, ecmwf_client, mock_opendata):
         """Request dict passed to client.retrieve must have all required ECMWF API fields."""
         _, mock_client_instance = mock_opendata
@@ -22,6 +22,7 @@ from pipeline_python.defs.assets import (
     ingest_ecmwf_data,
 )
 from pipeline_python.defs.models import RawFileRecord
+from pipeline_python.storage import ObjectStore
 
 
 # ---------------------------------------------------------------------------
@@ -71,7 +72,7 @@ class MockCdsClient(dg.ConfigurableResource):
         target.touch()
 
 
-class MockObjectStore(dg.ConfigurableResource):
+class MockObjectStore(ObjectStore):
     """Mock object store that records upload calls."""
 
     should_fail: bool = False
@@ -111,18 +112,23 @@ def _reset_mock_state():
     _catalog_raw_inserts = []
 
 
-def _make_resources(**overrides):
-    """Build resource dict for asset tests.
+@pytest.fixture
+def make_resources(object_store_settings):
+    """Factory building the resource dict for asset tests.
 
     Shared resources (object_store, catalog) have mock defaults.
     Pipeline-specific clients must be passed explicitly.
     """
-    defaults = {
-        "object_store": MockObjectStore(),
-        "catalog": MockCatalogResource(),
-    }
-    defaults.update(overrides)
-    return defaults
+
+    def _make_resources(**overrides):
+        defaults = {
+            "object_store": MockObjectStore(**object_store_settings),
+            "catalog": MockCatalogResource(),
+        }
+        defaults.update(overrides)
+        return defaults
+
+    return _make_resources
 
 
 # ---------------------------------------------------------------------------
@@ -133,11 +139,11 @@ def _make_resources(**overrides):
 class TestIngestCamsDataAsset:
     """Tests for the ingest_cams_data asset."""
 
-    def test_calls_cds_with_domain_args(self):
+    def test_calls_cds_with_domain_args(self, make_resources):
         """Core happy path: CDS called with correct args, upload key + catalog record are right."""
         result = dg.materialize(
             assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient()),
+            resources=make_resources(cds_client=MockCdsClient()),
             partition_key="2026-01-15",
         )
 
@@ -164,11 +170,11 @@ class TestIngestCamsDataAsset:
         assert record.source == "ads"
         assert record.dataset == _AIR_QUALITY_FORECAST
 
-    def test_forwards_horizon_from_config(self):
+    def test_forwards_horizon_from_config(self, make_resources):
         """Config horizon_hours plumbed through to CDS client."""
         result = dg.materialize(
             assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient()),
+            resources=make_resources(cds_client=MockCdsClient()),
             partition_key="2026-01-15",
             run_config={
                 "ops": {
@@ -182,11 +188,11 @@ class TestIngestCamsDataAsset:
         assert result.success
         assert _mock_cds_calls[0]["max_leadtime_hours"] == 24
 
-    def test_metadata_contains_keys_for_transform(self):
+    def test_metadata_contains_keys_for_transform(self, make_resources):
         """Contract: transform_cams_data reads run_id, dataset, date, source from upstream metadata."""
         result = dg.materialize(
             assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient()),
+            resources=make_resources(cds_client=MockCdsClient()),
             partition_key="2026-01-15",
         )
 
@@ -200,40 +206,43 @@ class TestIngestCamsDataAsset:
         assert metadata["dataset"].value == _AIR_QUALITY_FORECAST
         uuid.UUID(metadata["run_id"].value)  # raises if not a valid UUID
 
-    def test_generates_unique_run_ids(self):
+    def test_generates_unique_run_ids(self, make_resources):
         """Each materialization must produce a distinct run_id (idempotency safety)."""
-        dg.materialize(
-            assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient()),
-            partition_key="2026-01-15",
-        )
-        dg.materialize(
-            assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient()),
-            partition_key="2026-01-16",
-        )
+        with dg.DagsterInstance.ephemeral() as instance:
+            dg.materialize(
+                assets=[ingest_cams_data],
+                resources=make_resources(cds_client=MockCdsClient()),
+                partition_key="2026-01-15",
+                instance=instance,
+            )
+            dg.materialize(
+                assets=[ingest_cams_data],
+                resources=make_resources(cds_client=MockCdsClient()),
+                partition_key="2026-01-16",
+                instance=instance,
+            )
 
         assert len(_mock_uploads) == 2
         id1 = _mock_uploads[0]["key"].split("/")[-1].replace(".grib", "")
         id2 = _mock_uploads[1]["key"].split("/")[-1].replace(".grib", "")
         assert id1 != id2
 
-    def test_fails_on_catalog_failure(self):
+    def test_fails_on_catalog_failure(self, make_resources):
         """Catalog insert is fatal — asset must fail (licensing requires lineage)."""
         result = dg.materialize(
             assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient(), catalog=MockCatalogResource(should_fail=True)),
+            resources=make_resources(cds_client=MockCdsClient(), catalog=MockCatalogResource(should_fail=True)),
             partition_key="2026-01-15",
             raise_on_error=False,
         )
 
         assert not result.success
 
-    def test_propagates_cds_failure(self):
+    def test_propagates_cds_failure(self, make_resources):
         """CDS API failure is fatal — asset must fail."""
         result = dg.materialize(
             assets=[ingest_cams_data],
-            resources=_make_resources(cds_client=MockCdsClient(should_fail=True)),
+            resources=make_resources(cds_client=MockCdsClient(should_fail=True)),
             partition_key="2026-01-15",
             raise_on_error=False,
         )
@@ -249,11 +258,13 @@ class TestIngestCamsDataAsset:
 class TestCamsForecastConfig:
     """Tests for CamsForecastConfig defaults and overrides."""
 
-    def test_default_horizon(self):
-        assert CamsForecastConfig().horizon_hours == 48
-
-    def test_custom_horizon(self):
-        assert CamsForecastConfig(horizon_hours=24).horizon_hours == 24
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_horizon"),
+        [({}, 48), ({"horizon_hours": 24}, 24)],
+        ids=["default", "custom"],
+    )
+    def test_horizon(self, kwargs, expected_horizon):
+        assert CamsForecastConfig(**kwargs).horizon_hours == expected_horizon
 
 
 # ---------------------------------------------------------------------------
@@ -276,11 +287,11 @@ class TestAirQualityForecastConstant:
 class TestIngestEcmwfDataAsset:
     """Tests for the ingest_ecmwf_data asset."""
 
-    def test_calls_ecmwf_with_domain_args(self):
+    def test_calls_ecmwf_with_domain_args(self, make_resources):
         """ECMWF client called with correct date and variable names."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
+            resources=make_resources(ecmwf_client=MockEcmwfClient()),
             partition_key="2026-01-15",
         )
 
@@ -291,11 +302,11 @@ class TestIngestEcmwfDataAsset:
         assert call["variables"] == ["temperature", "dewpoint"]
         assert call["max_leadtime_hours"] == 48
 
-    def test_forwards_horizon_from_config(self):
+    def test_forwards_horizon_from_config(self, make_resources):
         """Config horizon_hours plumbed through to ECMWF client."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
+            resources=make_resources(ecmwf_client=MockEcmwfClient()),
             partition_key="2026-01-15",
             run_config={
                 "ops": {
@@ -309,11 +320,11 @@ class TestIngestEcmwfDataAsset:
         assert result.success
         assert _mock_ecmwf_calls[0]["max_leadtime_hours"] == 24
 
-    def test_uploads_to_correct_s3_path(self):
+    def test_uploads_to_correct_s3_path(self, make_resources):
         """Upload key must match the expected pattern for the future transform asset."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
+            resources=make_resources(ecmwf_client=MockEcmwfClient()),
             partition_key="2026-01-15",
         )
 
@@ -325,11 +336,11 @@ class TestIngestEcmwfDataAsset:
             key,
         )
 
-    def test_records_catalog_entry(self):
+    def test_records_catalog_entry(self, make_resources):
         """Catalog insert must record correct source and dataset for lineage."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
+            resources=make_resources(ecmwf_client=MockEcmwfClient()),
             partition_key="2026-01-15",
         )
 
@@ -339,11 +350,11 @@ class TestIngestEcmwfDataAsset:
         assert record.source == "ecmwf"
         assert record.dataset == _WEATHER_FORECAST
 
-    def test_metadata_contains_keys_for_transform(self):
+    def test_metadata_contains_keys_for_transform(self, make_resources):
         """Contract: future transform_ecmwf_data will read these keys from upstream metadata."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
+            resources=make_resources(ecmwf_client=MockEcmwfClient()),
             partition_key="2026-01-15",
         )
 
@@ -356,40 +367,43 @@ class TestIngestEcmwfDataAsset:
 
         uuid.UUID(metadata["run_id"].value)  # raises if not a valid UUID
 
-    def test_generates_unique_run_ids(self):
+    def test_generates_unique_run_ids(self, make_resources):
         """Each materialization must produce a distinct run_id (idempotency safety)."""
-        dg.materialize(
-            assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
-            partition_key="2026-01-15",
-        )
-        dg.materialize(
-            assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient()),
-            partition_key="2026-01-16",
-        )
+        with dg.DagsterInstance.ephemeral() as instance:
+            dg.materialize(
+                assets=[ingest_ecmwf_data],
+                resources=make_resources(ecmwf_client=MockEcmwfClient()),
+                partition_key="2026-01-15",
+                instance=instance,
+            )
+            dg.materialize(
+                assets=[ingest_ecmwf_data],
+                resources=make_resources(ecmwf_client=MockEcmwfClient()),
+                partition_key="2026-01-16",
+                instance=instance,
+            )
 
         assert len(_mock_uploads) == 2
         id1 = _mock_uploads[0]["key"].split("/")[-1].replace(".grib", "")
         id2 = _mock_uploads[1]["key"].split("/")[-1].replace(".grib", "")
         assert id1 != id2
 
-    def test_fails_on_catalog_failure(self):
+    def test_fails_on_catalog_failure(self, make_resources):
         """Catalog insert is fatal — asset must fail (licensing requires lineage)."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient(), catalog=MockCatalogResource(should_fail=True)),
+            resources=make_resources(ecmwf_client=MockEcmwfClient(), catalog=MockCatalogResource(should_fail=True)),
             partition_key="2026-01-15",
             raise_on_error=False,
         )
 
         assert not result.success
 
-    def test_propagates_ecmwf_client_failure(self):
+    def test_propagates_ecmwf_client_failure(self, make_resources):
         """ECMWF client failure is fatal — asset must fail."""
         result = dg.materialize(
             assets=[ingest_ecmwf_data],
-            resources=_make_resources(ecmwf_client=MockEcmwfClient(should_fail=True)),
+            resources=make_resources(ecmwf_client=MockEcmwfClient(should_fail=True)),
             partition_key="2026-01-15",
             raise_on_error=False,
         )
@@ -405,11 +419,13 @@ class TestIngestEcmwfDataAsset:
 class TestEcmwfForecastConfig:
     """Tests for EcmwfForecastConfig defaults and overrides."""
 
-    def test_default_horizon(self):
-        assert EcmwfForecastConfig().horizon_hours == 48
-
-    def test_custom_horizon(self):
-        assert EcmwfForecastConfig(horizon_hours=24).horizon_hours == 24
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_horizon"),
+        [({}, 48), ({"horizon_hours": 24}, 24)],
+        ids=["default", "custom"],
+    )
+    def test_horizon(self, kwargs, expected_horizon):
+        assert EcmwfForecastConfig(**kwargs).horizon_hours == expected_horizon
 
 
 class TestWeatherForecastConstant:
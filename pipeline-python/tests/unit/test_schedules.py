@@ -9,15 +9,31 @@ from datetime import datetime
 import dagster as dg
 import pytest
 
-
-@pytest.fixture
-def postgres_env(monkeypatch):
-    """Set up required postgres environment variables for definition loading."""
-    monkeypatch.setenv("POSTGRES_USER", "test")
-    monkeypatch.setenv("POSTGRES_PASSWORD", "test")
-    monkeypatch.setenv("POSTGRES_HOST", "localhost")
-    monkeypatch.setenv("POSTGRES_PORT", "5432")
-    monkeypatch.setenv("POSTGRES_DB", "test")
+from pipeline_python.definitions import defs
+from pipeline_python.defs.assets import (
+    ingest_cams_data,
+    optimize_cams_data,
+    optimize_ecmwf_data,
+    transform_cams_data,
+    transform_ecmwf_data,
+)
+from pipeline_python.defs.schedules import cams_daily_schedule, ecmwf_daily_schedule
+
+
+@pytest.fixture(scope="module")
+def loaded_defs():
+    """Load project definitions once per module with postgres environment variables set.
+
+    Resolving defs() walks the whole defs folder, so share a single result
+    across the read-only registration tests instead of reloading per test.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("POSTGRES_USER", "test")
+        mp.setenv("POSTGRES_PASSWORD", "test")
+        mp.setenv("POSTGRES_HOST", "localhost")
+        mp.setenv("POSTGRES_PORT", "5432")
+        mp.setenv("POSTGRES_DB", "test")
+        yield defs()
 
 
 def _mock_schedule_context(scheduled_execution_time: datetime) -> dg.ScheduleEvaluationContext:
@@ -27,82 +43,71 @@ def _mock_schedule_context(scheduled_execution_time: datetime) -> dg.ScheduleEva
     )
 
 
+@pytest.fixture(scope="module")
+def cams_context() -> dg.ScheduleEvaluationContext:
+    """Context at the CAMS schedule's usual tick (2025-03-12 08:00), shared across read-only tests."""
+    return _mock_schedule_context(datetime(2025, 3, 12, 8, 0, 0))
+
+
+@pytest.fixture(scope="module")
+def ecmwf_context() -> dg.ScheduleEvaluationContext:
+    """Context at the ECMWF schedule's usual tick (2025-03-12 09:30), shared across read-only tests."""
+    return _mock_schedule_context(datetime(2025, 3, 12, 9, 30, 0))
+
+
 class TestCamsDailySchedule:
     """Tests for the cams_daily_schedule."""
 
-    def test_schedule_generates_run_request(self):
+    def test_schedule_generates_run_request(self, cams_context):
         """Schedule should generate a RunRequest when evaluated."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
-        now = datetime(2025, 3, 12, 8, 0, 0)
-        context = _mock_schedule_context(now)
-
-        request = cams_daily_schedule(context)
+        request = cams_daily_schedule(cams_context)
 
         assert request is not None
         assert isinstance(request, dg.RunRequest)
 
-    def test_schedule_processes_today_partition(self):
+    def test_schedule_processes_today_partition(self, cams_context):
         """Schedule should materialize today's partition."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
         # If scheduled_execution_time is 2025-03-12,
         # it should process 2025-03-12
-        scheduled_date = datetime(2025, 3, 12, 8, 0, 0)
-        context = _mock_schedule_context(scheduled_date)
-
-        request = cams_daily_schedule(context)
+        request = cams_daily_schedule(cams_context)
 
         # Expected partition: 2025-03-12
         assert request.partition_key == "2025-03-12"
 
-    def test_schedule_partition_format(self):
-        """Schedule should format partition key as YYYY-MM-DD."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
-        # Test various dates to ensure consistent formatting
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("scheduled_time", "expected_partition"),
+        [
             (datetime(2025, 1, 2, 8, 0, 0), "2025-01-02"),  # Day 1->1
             (datetime(2025, 2, 28, 8, 0, 0), "2025-02-28"),  # Month boundary
             (datetime(2025, 3, 31, 8, 0, 0), "2025-03-31"),  # Month boundary
             (datetime(2025, 12, 31, 8, 0, 0), "2025-12-31"),  # Year boundary
-        ]
-
-        for scheduled_time, expected_partition in test_cases:
-            context = _mock_schedule_context(scheduled_time)
-            request = cams_daily_schedule(context)
-            assert request.partition_key == expected_partition
+        ],
+    )
+    def test_schedule_partition_format(self, scheduled_time, expected_partition):
+        """Schedule should format partition key as YYYY-MM-DD."""
+        context = _mock_schedule_context(scheduled_time)
+        request = cams_daily_schedule(context)
+        assert request.partition_key == expected_partition
 
-    def test_schedule_run_key_includes_date(self):
+    def test_schedule_run_key_includes_date(self, cams_context):
         """Schedule should include date in run_key for idempotency."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
-        scheduled_date = datetime(2025, 3, 12, 8, 0, 0)
-        context = _mock_schedule_context(scheduled_date)
-
-        request = cams_daily_schedule(context)
+        request = cams_daily_schedule(cams_context)
 
         # run_key should be unique per partition
         assert request.run_key == "cams_daily_2025-03-12"
 
-    def test_schedule_tags_include_metadata(self):
+    def test_schedule_tags_include_metadata(self, cams_context):
         """Schedule should tag runs with source, pipeline, and date."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
-        scheduled_date = datetime(2025, 3, 12, 8, 0, 0)
-        context = _mock_schedule_context(scheduled_date)
-
-        request = cams_daily_schedule(context)
+        request = cams_daily_schedule(cams_context)
 
-        assert request.tags is not None
-        assert request.tags.get("source") == "schedule"
-        assert request.tags.get("pipeline") == "cams"
-        assert request.tags.get("scheduled_date") == "2025-03-12"
+        assert dict(request.tags) == {
+            "source": "schedule",
+            "pipeline": "cams",
+            "scheduled_date": "2025-03-12",
+        }
 
     def test_schedule_consistent_across_runs(self):
         """Multiple evaluations for the same scheduled time should produce identical results."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
         scheduled_date = datetime(2025, 3, 12, 8, 0, 0)
 
         # Create two independent contexts at the same time
@@ -119,8 +124,6 @@ class TestCamsDailySchedule:
 
     def test_schedule_handles_leap_year(self):
         """Schedule should correctly handle leap year dates."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
         # 2024 is a leap year; test Feb 29
         scheduled_date = datetime(2024, 2, 29, 8, 0, 0)
         context = _mock_schedule_context(scheduled_date)
@@ -130,77 +133,52 @@ class TestCamsDailySchedule:
         # Should process Feb 29 (leap day)
         assert request.partition_key == "2024-02-29"
 
-    def test_schedule_with_different_time_of_day(self):
+    @pytest.mark.parametrize("hour", [0, 6, 12, 18, 23])
+    def test_schedule_with_different_time_of_day(self, hour):
         """Schedule should work regardless of what time of day it's evaluated."""
-        from pipeline_python.defs.schedules import cams_daily_schedule
-
-        base_date = datetime(2025, 3, 12, 0, 0, 0)  # Midnight
-
-        # Test evaluation at different times of the same day
-        for hour in [0, 6, 12, 18, 23]:
-            scheduled_time = base_date.replace(hour=hour)
-            context = _mock_schedule_context(scheduled_time)
+        scheduled_time = datetime(2025, 3, 12, hour, 0, 0)
+        context = _mock_schedule_context(scheduled_time)
 
-            request = cams_daily_schedule(context)
+        request = cams_daily_schedule(context)
 
-            # Regardless of hour, should still process today's partition
-            assert request.partition_key == "2025-03-12"
+        # Regardless of hour, should still process today's partition
+        assert request.partition_key == "2025-03-12"
 
 
 class TestEcmwfDailySchedule:
     """Tests for the ecmwf_daily_schedule."""
 
-    def test_schedule_generates_run_request(self):
+    def test_schedule_generates_run_request(self, ecmwf_context):
         """Schedule should generate a RunRequest when evaluated."""
-        from pipeline_python.defs.schedules import ecmwf_daily_schedule
-
-        now = datetime(2025, 3, 12, 9, 30, 0)
-        context = _mock_schedule_context(now)
-
-        request = ecmwf_daily_schedule(context)
+        request = ecmwf_daily_schedule(ecmwf_context)
 
         assert request is not None
         assert isinstance(request, dg.RunRequest)
 
-    def test_schedule_processes_today_partition(self):
+    def test_schedule_processes_today_partition(self, ecmwf_context):
         """Schedule should materialize today's partition."""
-        from pipeline_python.defs.schedules import ecmwf_daily_schedule
-
-        scheduled_date = datetime(2025, 3, 12, 9, 30, 0)
-        context = _mock_schedule_context(scheduled_date)
-
-        request = ecmwf_daily_schedule(context)
+        request = ecmwf_daily_schedule(ecmwf_context)
 
         assert request.partition_key == "2025-03-12"
 
-    def test_schedule_run_key_includes_date(self):
+    def test_schedule_run_key_includes_date(self, ecmwf_context):
         """Schedule should include date in run_key for idempotency."""
-        from pipeline_python.defs.schedules import ecmwf_daily_schedule
-
-        scheduled_date = datetime(2025, 3, 12, 9, 30, 0)
-        context = _mock_schedule_context(scheduled_date)
-
-        request = ecmwf_daily_schedule(context)
+        request = ecmwf_daily_schedule(ecmwf_context)
 
         assert request.run_key == "ecmwf_daily_2025-03-12"
 
-    def test_schedule_tags_include_metadata(self):
+    def test_schedule_tags_include_metadata(self, ecmwf_context):
         """Schedule should tag runs with source, pipeline, and date."""
-        from pipeline_python.defs.schedules import ecmwf_daily_schedule
+        request = ecmwf_daily_schedule(ecmwf_context)
 
-        scheduled_date = datetime(2025, 3, 12, 9, 30, 0)
-        context = _mock_schedule_context(scheduled_date)
-
-        request = ecmwf_daily_schedule(context)
-
-        assert request.tags is not None
-        assert request.tags.get("source") == "schedule"
-        assert request.tags.get("pipeline") == "ecmwf"
+        assert dict(request.tags) == {
+            "source": "schedule",
+            "pipeline": "ecmwf",
+            "scheduled_date": "2025-03-12",
+        }
 
     def test_schedule_consistent_across_runs(self):
         """Multiple evaluations for the same scheduled time should produce identical results."""
-        from pipeline_python.defs.schedules import ecmwf_daily_schedule
-
         scheduled_date = datetime(2025, 3, 12, 9, 30, 0)
 
         context1 = _mock_schedule_context(scheduled_date)
@@ -217,38 +195,30 @@ class TestEcmwfDailySchedule:
 class TestScheduleDefinitions:
     """Tests for schedule registration and discovery."""
 
-    def test_schedules_are_loadable(self, postgres_env):
+    def test_schedules_are_loadable(self, loaded_defs):
         """Schedules should be loadable from definitions."""
-        from pipeline_python.definitions import defs
-
-        definitions = defs()
+        definitions = loaded_defs
 
         assert definitions.schedules is not None
         assert len(definitions.schedules) > 0
 
-    def test_cams_daily_schedule_registered(self, postgres_env):
+    def test_cams_daily_schedule_registered(self, loaded_defs):
         """cams_daily_schedule should be registered in definitions."""
-        from pipeline_python.definitions import defs
-
-        definitions = defs()
+        definitions = loaded_defs
 
         schedule_names = [s.name for s in definitions.schedules]
         assert "cams_daily_schedule" in schedule_names
 
-    def test_ecmwf_daily_schedule_registered(self, postgres_env):
+    def test_ecmwf_daily_schedule_registered(self, loaded_defs):
         """ecmwf_daily_schedule should be registered in definitions."""
-        from pipeline_python.definitions import defs
-
-        definitions = defs()
+        definitions = loaded_defs
 
         schedule_names = [s.name for s in definitions.schedules]
         assert "ecmwf_daily_schedule" in schedule_names
 
-    def test_schedule_job_is_defined(self, postgres_env):
+    def test_schedule_job_is_defined(self, loaded_defs):
         """Schedule should reference a valid job."""
-        from pipeline_python.definitions import defs
-
-        definitions = defs()
+        definitions = loaded_defs
 
         # Get the cams_daily_schedule
         schedule = next(s for s in definitions.schedules if s.name == "cams_daily_schedule")
@@ -260,11 +230,9 @@ class TestScheduleDefinitions:
 class TestScheduleJobDependencies:
     """Tests for the job that the schedule triggers."""
 
-    def test_schedule_job_includes_both_assets(self, postgres_env):
+    def test_schedule_job_includes_both_assets(self, loaded_defs):
         """The job triggered by schedule should include both ingestion and transformation."""
-        from pipeline_python.definitions import defs
-
-        definitions = defs()
+        definitions = loaded_defs
 
         # Get the job from the schedule
         schedule = next(s for s in definitions.schedules if s.name == "cams_daily_schedule")
@@ -275,18 +243,11 @@ class TestScheduleJobDependencies:
 
     def test_transformation_depends_on_ingestion(self):
         """Transformation asset should depend on ingestion asset."""
-        from pipeline_python.defs.assets import ingest_cams_data, transform_cams_data
-
         # Check that transform_cams_data has ingest_cams_data as a dependency
         dep_keys = transform_cams_data.dependency_keys
         assert ingest_cams_data.key in dep_keys
 
     def test_optimization_depends_on_transformation(self):
         """Optimize assets should depend on their respective transform assets."""
-        from pipeline_python.defs.assets import (
-            optimize_cams_data, transform_cams_data,
-            optimize_ecmwf_data, transform_ecmwf_data,
-        )
-
         assert transform_cams_data.key in optimize_cams_data.dependency_keys
         assert transform_ecmwf_data.key in optimize_ecmwf_data.dependency_keys
@@ -0,0 +1,38 @@
+"""
+Shared fixtures for storage tests.
+"""
+from datetime import datetime
+from uuid import uuid7
+
+import numpy as np
+import pytest
+
+from pipeline_python.storage.grid_store import GridData
+
+# Shared read-only default arrays; tests needing other data override them.
+_DEFAULT_COORDS = np.ones((3, 6), dtype=np.float32)
+_DEFAULT_VALUES = np.full((3, 6), 15.0, dtype=np.float32)
+_DEFAULT_COORDS.flags.writeable = False
+_DEFAULT_VALUES.flags.writeable = False
+
+
+@pytest.fixture
+def make_grid():
+    """Factory for valid GridData with 2D arrays of shape (3, 6). Override any field.
+
+    Each grid gets a fresh uuid7 catalog_id; the default arrays are shared.
+    """
+
+    def _make_grid(**overrides) -> GridData:
+        defaults = dict(
+            variable="pm2p5",
+            unit="µg/m³",
+            timestamp=datetime(2026, 1, 1, 2, 0, 0),
+            lats=_DEFAULT_COORDS,
+            lons=_DEFAULT_COORDS,
+            values=_DEFAULT_VALUES,
+            catalog_id=uuid7(),
+        )
+        return GridData(**{**defaults, **overrides})
+
+    return _make_grid
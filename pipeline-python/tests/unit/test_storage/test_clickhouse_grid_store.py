@@ -0,0 +1,175 @@
+"""
+Tests for ClickHouseGridStore (storage/clickhouse_grid_store.py) with a mocked client.
+"""
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from pipeline_python.storage.clickhouse_grid_store import ClickHouseGridStore
+
+_PATCH_TARGET = "pipeline_python.storage.clickhouse_grid_store.clickhouse_connect.get_client"
+
+
+@pytest.fixture
+def mock_client():
+    """Provide a mock clickhouse-connect client returning an insert summary."""
+    client = Mock()
+    client.insert.return_value = Mock(written_rows=18)
+    with patch(_PATCH_TARGET, return_value=client):
+        yield client
+
+
+@pytest.fixture
+def grid_store():
+    return ClickHouseGridStore(
+        host="localhost",
+        port=8123,
+        username="default",
+        password="",
+        database="jackfruit",
+    )
+
+
+class TestClickHouseGridStoreClient:
+    """Tests for lazy client construction."""
+
+    def test_client_receives_connection_config(self, grid_store, make_grid):
+        with patch(_PATCH_TARGET) as mock_get_client:
+            grid_store.insert_grid(make_grid())
+
+        mock_get_client.assert_called_once_with(
+            host="localhost",
+            username="default",
+            password="",
+            database="jackfruit",
+            port=8123,
+            compress="lz4",
+        )
+
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [({}, "lz4"), ({"compression": "zstd"}, "zstd")],
+        ids=["default", "custom"],
+    )
+    def test_compression_setting_is_passed_through(self, make_grid, overrides, expected):
+        """The configured compression should reach clickhouse-connect's compress argument unchanged."""
+        store = ClickHouseGridStore(
+            host="localhost",
+            port=8123,
+            username="default",
+            password="",
+            database="jackfruit",
+            **overrides,
+        )
+        with patch(_PATCH_TARGET) as mock_get_client:
+            store.insert_grid(make_grid())
+
+        assert mock_get_client.call_args.kwargs["compress"] == expected
+
+    def test_reuses_client_within_execution(self, grid_store, make_grid):
+        """Several inserts in one asset execution should share one lazily created client."""
+        with patch(_PATCH_TARGET) as mock_get_client:
+            grid_store.insert_grid(make_grid())
+            grid_store.insert_grid(make_grid())
+
+        mock_get_client.assert_called_once()
+        assert mock_get_client.return_value.insert.call_count == 2
+
+    def test_teardown_closes_client(self, grid_store, mock_client, make_grid):
+        """teardown_after_execution should close the client opened for the execution."""
+        grid_store.insert_grid(make_grid())
+        grid_store.teardown_after_execution(None)
+
+        mock_client.close.assert_called_once()
+
+    def test_teardown_without_client_is_noop(self, grid_store, mock_client):
+        """teardown_after_execution should not open a client just to close it."""
+        grid_store.teardown_after_execution(None)
+
+        mock_client.close.assert_not_called()
+
+
+class TestClickHouseGridStoreInsertGrid:
+    """Tests for insert_grid column construction."""
+
+    def test_returns_written_rows(self, grid_store, mock_client, make_grid):
+        assert grid_store.insert_grid(make_grid()) == 18
+
+    def test_constant_columns_repeat_grid_fields(self, grid_store, mock_client, make_grid):
+        """variable/unit/catalog_id should repeat the grid value once per row."""
+        grid = make_grid()
+        grid_store.insert_grid(grid)
+
+        kwargs = mock_client.insert.call_args.kwargs
+        columns = dict(zip(kwargs["column_names"], kwargs["data"]))
+        for name in ("variable", "unit", "catalog_id"):
+            assert len(columns[name]) == grid.row_count
+            assert all(v == getattr(grid, name) for v in columns[name])
+
+    def test_timestamp_column_is_epoch_seconds(self, grid_store, mock_client, make_grid):
+        """timestamp should be pre-converted to int epoch seconds, matching the driver's conversion."""
+        grid = make_grid()
+        grid_store.insert_grid(grid)
+
+        kwargs = mock_client.insert.call_args.kwargs
+        columns = dict(zip(kwargs["column_names"], kwargs["data"]))
+        assert len(columns["timestamp"]) == grid.row_count
+        assert all(type(v) is int for v in columns["timestamp"])
+        assert columns["timestamp"][0] == int(grid.timestamp.timestamp())
+
+    def test_constant_columns_are_not_materialized(self, grid_store, mock_client, make_grid):
+        """Constant columns should be stride-0 views, not row_count-long copies."""
+        grid_store.insert_grid(make_grid())
+
+        kwargs = mock_client.insert.call_args.kwargs
+        columns = dict(zip(kwargs["column_names"], kwargs["data"]))
+        assert columns["variable"].strides == (0,)
+
+    def test_float32_columns_reuse_contiguous_input(self, grid_store, mock_client, make_grid):
+        """C-contiguous float32 arrays should be flattened without a copy."""
+        grid = make_grid()
+        grid_store.insert_grid(grid)
+
+        kwargs = mock_client.insert.call_args.kwargs
+        columns = dict(zip(kwargs["column_names"], kwargs["data"]))
+        assert np.shares_memory(columns["value"], grid.values)
+        assert columns["value"].shape == (grid.row_count,)
+
+    def test_float64_columns_are_cast_to_float32(self, grid_store, mock_client, make_grid):
+        """Non-float32 inputs should be cast to 1D float32 columns."""
+        grid = make_grid(values=np.full((3, 6), 2.5, dtype=np.float64))
+        grid_store.insert_grid(grid)
+
+        kwargs = mock_client.insert.call_args.kwargs
+        columns = dict(zip(kwargs["column_names"], kwargs["data"]))
+        assert columns["value"].dtype == np.float32
+        assert columns["value"].shape == (grid.row_count,)
+        assert np.all(columns["value"] == 2.5)
+
+
+class TestClickHouseGridStoreInsertGrids:
+    """Tests for batched insert_grids."""
+
+    def test_single_insert_for_many_grids(self, grid_store, mock_client, make_grid):
+        """All grids should be concatenated into one insert call."""
+        grid_store.insert_grids([make_grid(), make_grid(variable="pm10")])
+        mock_client.insert.assert_called_once()
+
+    def test_columns_concatenate_grids_in_order(self, grid_store, mock_client, make_grid):
+        """Constant columns repeat per grid; float columns are concatenated as float32."""
+        first = make_grid()
+        second = make_grid(variable="pm10", values=np.full((2, 2), 7.0), lats=np.zeros((2, 2)), lons=np.zeros((2, 2)))
+        grid_store.insert_grids([first, second])
+
+        kwargs = mock_client.insert.call_args.kwargs
+        columns = dict(zip(kwargs["column_names"], kwargs["data"]))
+        assert list(columns["variable"]) == ["pm2p5"] * 18 + ["pm10"] * 4
+        assert list(columns["catalog_id"]) == [first.catalog_id] * 18 + [second.catalog_id] * 4
+        assert columns["value"].dtype == np.float32
+        assert columns["value"].shape == (22,)
+        assert np.all(columns["value"][18:] == 7.0)
+
+    def test_no_grids_skips_insert(self, grid_store, mock_client):
+        assert grid_store.insert_grids([]) == 0
+        mock_client.insert.assert_not_called()
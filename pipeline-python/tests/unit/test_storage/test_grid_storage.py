@@ -1,8 +1,6 @@
 """
 Tests for the generic grid storage module (just the data class).
 """
-from datetime import datetime
-from uuid import uuid7
 
 import numpy as np
 import pytest
@@ -10,52 +8,73 @@ import pytest
 from pipeline_python.storage.grid_store import GridData, GridStore
 
 
-def _make_grid(**overrides) -> GridData:
-    """Build a valid GridData with 2D arrays of shape (3, 6). Override any field."""
-    defaults = dict(
-        variable="temp",
-        unit="°C",
-        timestamp=datetime(2026, 1, 1, 2, 0, 0),
-        lats=np.ones((3, 6), dtype=np.float32),
-        lons=np.ones((3, 6), dtype=np.float32),
-        values=np.ones((3, 6), dtype=np.float32) * 15.0,
-        catalog_id=uuid7(),
-    )
-    return GridData(**{**defaults, **overrides})
-
-
 class TestGridData:
-    def test_row_count(self):
-        grid = _make_grid()
+    def test_row_count(self, make_grid):
+        grid = make_grid()
         assert grid.row_count == 18
 
-    def test_accepts_single_element_grid(self):
-        grid = _make_grid(
+    def test_accepts_single_element_grid(self, make_grid):
+        grid = make_grid(
             lats=np.ones((1, 1), dtype=np.float32),
             lons=np.ones((1, 1), dtype=np.float32),
             values=np.ones((1, 1), dtype=np.float32),
         )
         assert grid.row_count == 1
 
-    def test_rejects_1d_values(self):
+    def test_coerces_arrays_to_float32(self, make_grid):
+        grid = make_grid(
+            lats=np.ones((3, 6)),
+            lons=np.ones((3, 6)),
+            values=np.full((3, 6), 2.5),
+        )
+        for array in (grid.lats, grid.lons, grid.values):
+            assert array.dtype == np.float32
+            assert array.flags.c_contiguous
+        assert np.all(grid.values == 2.5)
+
+    def test_keeps_float32_arrays_without_copy(self, make_grid):
+        values = np.ones((3, 6), dtype=np.float32)
+        grid = make_grid(values=values)
+        assert grid.values is values
+
+    def test_has_no_instance_dict(self, make_grid):
+        """GridData is slotted — no per-instance __dict__."""
+        grid = make_grid()
+        assert not hasattr(grid, "__dict__")
+
+    def test_rejects_positional_args(self, make_grid):
+        """All seven fields passed positionally are rejected only because GridData is kw_only."""
+        grid = make_grid()
+        with pytest.raises(TypeError, match="positional argument"):
+            GridData(
+                grid.variable,
+                grid.unit,
+                grid.timestamp,
+                grid.lats,
+                grid.lons,
+                grid.values,
+                grid.catalog_id,
+            )
+
+    def test_rejects_1d_values(self, make_grid):
         with pytest.raises(ValueError, match="values must be 2-dimensional"):
-            _make_grid(values=np.ones(18, dtype=np.float32))
+            make_grid(values=np.ones(18, dtype=np.float32))
 
-    def test_rejects_3d_values(self):
+    def test_rejects_3d_values(self, make_grid):
         with pytest.raises(ValueError, match="values must be 2-dimensional"):
-            _make_grid(values=np.ones((3, 6, 1), dtype=np.float32))
+            make_grid(values=np.ones((3, 6, 1), dtype=np.float32))
 
-    def test_rejects_shape_mismatch_lats(self):
+    def test_rejects_shape_mismatch_lats(self, make_grid):
         with pytest.raises(ValueError, match="All arrays must have the same shape"):
-            _make_grid(lats=np.ones((2, 6), dtype=np.float32))
+            make_grid(lats=np.ones((2, 6), dtype=np.float32))
 
-    def test_rejects_shape_mismatch_lons(self):
+    def test_rejects_shape_mismatch_lons(self, make_grid):
         with pytest.raises(ValueError, match="All arrays must have the same shape"):
-            _make_grid(lons=np.ones((3, 4), dtype=np.float32))
+            make_grid(lons=np.ones((3, 4), dtype=np.float32))
 
-    def test_rejects_1d_lats_with_2d_values(self):
+    def test_rejects_1d_lats_with_2d_values(self, make_grid):
         with pytest.raises(ValueError, match="All arrays must have the same shape"):
-            _make_grid(lats=np.ones(18, dtype=np.float32))
+            make_grid(lats=np.ones(18, dtype=np.float32))
 
 
 class TestGridStoreCompact:
@@ -81,3 +100,27 @@ class TestGridStoreCompact:
                 return 0
 
         assert MinimalStore().compact() is None
+
+
+class TestGridStoreInsertGrids:
+    """Tests for the GridStore.insert_grids() default."""
+
+    def test_default_inserts_each_grid(self, make_grid):
+        """The default insert_grids() should delegate to insert_grid() per grid and sum rows."""
+        inserted: list[GridData] = []
+
+        class MinimalStore(GridStore):
+            def insert_grid(self, grid: GridData) -> int:
+                inserted.append(grid)
+                return grid.row_count
+
+        grids = [make_grid(), make_grid(variable="humidity")]
+        assert MinimalStore().insert_grids(grids) == 36
+        assert inserted == grids
+
+    def test_default_returns_zero_for_no_grids(self):
+        class MinimalStore(GridStore):
+            def insert_grid(self, grid: GridData) -> int:
+                return grid.row_count
+
+        assert MinimalStore().insert_grids([]) == 0
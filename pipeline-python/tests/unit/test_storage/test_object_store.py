@@ -1,9 +1,8 @@
 """
 Tests for ObjectStore (storage/object_store.py).
 """
-import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -13,8 +12,19 @@ from pipeline_python.storage.object_store import ObjectStore
 
 @pytest.fixture
 def mock_s3_client():
-    """Provide a mock boto3 S3 client."""
-    return Mock()
+    """Provide a mock boto3 S3 client, patched in as the client factory's return value.
+
+    Specced to the transfer methods ObjectStore uses, so a misspelled call fails loudly.
+    """
+    client = Mock(spec=["download_file", "upload_file"])
+    with patch("pipeline_python.storage.object_store.boto3.client", return_value=client):
+        yield client
+
+
+@pytest.fixture(scope="module")
+def local_path(tmp_path_factory):
+    """Provide one local file path shared across tests; the mocked client never touches it."""
+    return tmp_path_factory.mktemp("object_store") / "file.grib"
 
 
 @pytest.fixture
@@ -32,109 +42,158 @@ def storage_resource():
 class TestObjectStoreDownloadRaw:
     """Tests for download_raw method."""
 
-    def test_downloads_file_successfully(self, storage_resource, mock_s3_client):
+    def test_downloads_file_successfully(self, storage_resource, mock_s3_client, local_path):
         """Should download file from raw bucket."""
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_path = Path(tmpdir) / "downloaded.grib"
+        storage_resource.download_raw("ads/dataset/2025-01-01/file.grib", local_path)
 
-                storage_resource.download_raw("ads/dataset/2025-01-01/file.grib", local_path)
-
-                mock_s3_client.download_file.assert_called_once_with(
-                    "test-raw",
-                    "ads/dataset/2025-01-01/file.grib",
-                    str(local_path),
-                )
+        mock_s3_client.download_file.assert_called_once_with(
+            "test-raw",
+            "ads/dataset/2025-01-01/file.grib",
+            str(local_path),
+        )
 
-    def test_creates_parent_directories(self, storage_resource, mock_s3_client):
+    def test_creates_parent_directories(self, storage_resource, mock_s3_client, tmp_path):
         """Should create parent directories if they don't exist."""
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_path = Path(tmpdir) / "nested" / "dir" / "downloaded.grib"
+        local_path = tmp_path / "nested" / "dir" / "downloaded.grib"
 
-                storage_resource.download_raw("ads/dataset/2025-01-01/file.grib", local_path)
+        storage_resource.download_raw("ads/dataset/2025-01-01/file.grib", local_path)
 
-                assert local_path.parent.exists()
-                assert local_path.parent.is_dir()
+        assert local_path.parent.is_dir()
 
-    def test_raises_error_for_empty_key(self, storage_resource):
+    @pytest.mark.parametrize("key", ["", "   "], ids=["empty", "whitespace"])
+    def test_raises_error_for_empty_key(self, storage_resource, key):
         """Should raise ValueError for empty key."""
         with pytest.raises(ValueError, match="cannot be empty"):
-            storage_resource.download_raw("", Path("/tmp/file.grib"))
-
-        with pytest.raises(ValueError, match="cannot be empty"):
-            storage_resource.download_raw("   ", Path("/tmp/file.grib"))
+            storage_resource.download_raw(key, Path("/tmp/file.grib"))
 
-    def test_raises_error_for_missing_file(self, storage_resource, mock_s3_client):
+    def test_raises_error_for_missing_file(self, storage_resource, mock_s3_client, local_path):
         """Should raise FileNotFoundError for missing S3 file."""
         error_response = {"Error": {"Code": "NoSuchKey", "Message": "Not found"}}
         mock_s3_client.download_file.side_effect = ClientError(error_response, "download_file")
 
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_path = Path(tmpdir) / "file.grib"
+        with pytest.raises(FileNotFoundError, match="test-raw"):
+            storage_resource.download_raw("missing/file.grib", local_path)
 
-                with pytest.raises(FileNotFoundError, match="test-raw"):
-                    storage_resource.download_raw("missing/file.grib", local_path)
-
-    def test_raises_error_for_404_code(self, storage_resource, mock_s3_client):
+    def test_raises_error_for_404_code(self, storage_resource, mock_s3_client, local_path):
         """Should raise FileNotFoundError for HTTP 404 error code (alternative to NoSuchKey)."""
         error_response = {"Error": {"Code": "404", "Message": "Not found"}}
         mock_s3_client.download_file.side_effect = ClientError(error_response, "download_file")
 
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_path = Path(tmpdir) / "file.grib"
-
-                with pytest.raises(FileNotFoundError, match="test-raw"):
-                    storage_resource.download_raw("missing/file.grib", local_path)
+        with pytest.raises(FileNotFoundError, match="test-raw"):
+            storage_resource.download_raw("missing/file.grib", local_path)
 
-    def test_reraises_unexpected_client_error(self, storage_resource, mock_s3_client):
+    def test_reraises_unexpected_client_error(self, storage_resource, mock_s3_client, local_path):
         """Should re-raise ClientError as-is for non-404 errors (e.g. access denied)."""
         error_response = {"Error": {"Code": "AccessDenied", "Message": "Forbidden"}}
         mock_s3_client.download_file.side_effect = ClientError(error_response, "download_file")
 
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with tempfile.TemporaryDirectory() as tmpdir:
-                local_path = Path(tmpdir) / "file.grib"
-
-                with pytest.raises(ClientError):
-                    storage_resource.download_raw("secret/file.grib", local_path)
+        with pytest.raises(ClientError):
+            storage_resource.download_raw("secret/file.grib", local_path)
 
 
 class TestObjectStoreUploadRaw:
     """Tests for upload_raw method."""
 
-    def test_uploads_file_successfully(self, storage_resource, mock_s3_client):
+    def test_uploads_file_successfully(self, storage_resource, mock_s3_client, local_path):
         """Should upload local file to raw bucket with correct args."""
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with tempfile.NamedTemporaryFile(suffix=".grib") as tmpfile:
-                local_path = Path(tmpfile.name)
-
-                storage_resource.upload_raw("ads/dataset/2025-01-01/file.grib", local_path)
+        storage_resource.upload_raw("ads/dataset/2025-01-01/file.grib", local_path)
 
-                mock_s3_client.upload_file.assert_called_once_with(
-                    str(local_path),
-                    "test-raw",
-                    "ads/dataset/2025-01-01/file.grib",
-                )
+        mock_s3_client.upload_file.assert_called_once_with(
+            str(local_path),
+            "test-raw",
+            "ads/dataset/2025-01-01/file.grib",
+        )
 
-    def test_raises_error_for_empty_key(self, storage_resource):
+    @pytest.mark.parametrize("key", ["", "   "], ids=["empty", "whitespace"])
+    def test_raises_error_for_empty_key(self, storage_resource, key):
         """Should raise ValueError for empty or whitespace-only key."""
         with pytest.raises(ValueError, match="cannot be empty"):
-            storage_resource.upload_raw("", Path("/tmp/file.grib"))
-
-        with pytest.raises(ValueError, match="cannot be empty"):
-            storage_resource.upload_raw("   ", Path("/tmp/file.grib"))
+            storage_resource.upload_raw(key, Path("/tmp/file.grib"))
 
     def test_raises_ioerror_on_client_error(self, storage_resource, mock_s3_client):
         """Should wrap ClientError as IOError on upload failure."""
         error_response = {"Error": {"Code": "NoSuchBucket", "Message": "Bucket not found"}}
         mock_s3_client.upload_file.side_effect = ClientError(error_response, "upload_file")
 
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client):
-            with pytest.raises(IOError, match="test-raw"):
-                storage_resource.upload_raw("ads/dataset/file.grib", Path("/tmp/file.grib"))
+        with pytest.raises(IOError, match="test-raw"):
+            storage_resource.upload_raw("ads/dataset/file.grib", Path("/tmp/file.grib"))
+
+
+class TestObjectStoreScopedTempfile:
+    """Tests for scoped_tempfile context manager."""
+
+    @pytest.fixture
+    def scratch_resource(self, tmp_path):
+        """Provide an ObjectStore whose scratch_dir is a per-test temp directory."""
+        return ObjectStore(
+            endpoint_url="http://localhost:9000",
+            access_key="test-access-key",
+            secret_key="test-secret-key",
+            raw_bucket="test-raw",
+            use_ssl=False,
+            scratch_dir=str(tmp_path),
+        )
+
+    def test_yields_path_directly_in_scratch_dir(self, scratch_resource, tmp_path):
+        """Should place the file flat in scratch_dir, named after the key's file name."""
+        with scratch_resource.scoped_tempfile("ads/dataset/2025-01-01/file.grib") as local_path:
+            assert local_path.parent == tmp_path
+            assert local_path.name.startswith("file.")
+            assert local_path.suffix == ".grib"
+
+    def test_concurrent_scopes_for_same_key_get_distinct_files(self, scratch_resource):
+        """Two runs handling the same key should never share (or unlink) each other's file."""
+        key = "ads/dataset/2025-01-01/file.grib"
+        with scratch_resource.scoped_tempfile(key) as first:
+            with scratch_resource.scoped_tempfile(key) as second:
+                assert first != second
+            assert first.exists()
+
+    def test_leaves_scratch_dir_empty_on_exit(self, scratch_resource, tmp_path):
+        """Should unlink the file and leave no per-key directories behind."""
+        with scratch_resource.scoped_tempfile("ads/dataset/2025-01-01/file.grib") as local_path:
+            local_path.write_bytes(b"GRIB")
+
+        assert not local_path.exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_removes_file_when_body_raises(self, scratch_resource, tmp_path):
+        """Should clean up even if the asset fails mid-download."""
+        with pytest.raises(RuntimeError):
+            with scratch_resource.scoped_tempfile("ads/dataset/2025-01-01/file.grib"):
+                raise RuntimeError("download failed")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_creates_missing_scratch_dir(self, tmp_path):
+        """Should create scratch_dir on first use."""
+        resource = ObjectStore(
+            endpoint_url="http://localhost:9000",
+            access_key="test-access-key",
+            secret_key="test-secret-key",
+            raw_bucket="test-raw",
+            use_ssl=False,
+            scratch_dir=str(tmp_path / "scratch"),
+        )
+
+        with resource.scoped_tempfile("file.grib") as local_path:
+            assert local_path.parent == tmp_path / "scratch"
+
+    @pytest.mark.parametrize(
+        "key",
+        ["/etc/file.grib", "../outside.grib", "ads/../../outside.grib"],
+        ids=["absolute", "parent", "nested-parent"],
+    )
+    def test_keeps_odd_keys_inside_scratch_dir(self, scratch_resource, tmp_path, key):
+        """Absolute keys or '..' segments should not move the file out of scratch_dir."""
+        with scratch_resource.scoped_tempfile(key) as local_path:
+            assert local_path.parent == tmp_path
+
+    def test_raises_error_for_empty_key(self, storage_resource):
+        """Should raise ValueError for empty key."""
+        with pytest.raises(ValueError, match="cannot be empty"):
+            with storage_resource.scoped_tempfile("   "):
+                pass
 
 
 class TestObjectStoreConfig:
@@ -156,15 +215,51 @@ class TestObjectStoreConfig:
         assert resource.raw_bucket == "my-raw-bucket"
         assert resource.use_ssl is True
 
-    def test_client_passes_credentials_to_boto3(self, storage_resource, mock_s3_client):
+    def test_scratch_dir_defaults_to_tmp(self, storage_resource):
+        """Should default scratch_dir to a fixed path under /tmp."""
+        assert storage_resource.scratch_dir == "/tmp/jackfruit-scratch"
+
+    def test_client_passes_credentials_to_boto3(self, storage_resource, local_path):
         """Should forward endpoint, credentials, and ssl flag to boto3.client."""
-        with patch("pipeline_python.storage.object_store.boto3.client", return_value=mock_s3_client) as mock_boto3:
-            storage_resource.download_raw("some/key.grib", Path("/tmp/file.grib"))
-
-            mock_boto3.assert_called_once_with(
-                "s3",
-                endpoint_url="http://localhost:9000",
-                aws_access_key_id="test-access-key",
-                aws_secret_access_key="test-secret-key",
-                use_ssl=False,
-            )
+        with patch("pipeline_python.storage.object_store.boto3.client") as mock_boto3:
+            storage_resource.download_raw("some/key.grib", local_path)
+
+        mock_boto3.assert_called_once_with(
+            "s3",
+            endpoint_url="http://localhost:9000",
+            aws_access_key_id="test-access-key",
+            aws_secret_access_key="test-secret-key",
+            use_ssl=False,
+            config=ANY,
+        )
+
+    @pytest.mark.parametrize(
+        ("overrides", "expected_pool_size"),
+        [({}, 10), ({"max_pool_connections": 32}, 32)],
+        ids=["default", "custom"],
+    )
+    def test_client_pool_size_is_configurable(self, local_path, overrides, expected_pool_size):
+        """Should pass max_pool_connections to boto3 through a botocore Config."""
+        resource = ObjectStore(
+            endpoint_url="http://localhost:9000",
+            access_key="test-access-key",
+            secret_key="test-secret-key",
+            raw_bucket="test-raw",
+            use_ssl=False,
+            **overrides,
+        )
+        with patch("pipeline_python.storage.object_store.boto3.client") as mock_boto3:
+            resource.download_raw("some/key.grib", local_path)
+
+        assert mock_boto3.call_args.kwargs["config"].max_pool_connections == expected_pool_size
+
+    def test_reuses_client_across_calls(self, storage_resource, local_path):
+        """Should build the boto3 client once and reuse it for later transfers."""
+        with patch("pipeline_python.storage.object_store.boto3.client") as mock_boto3:
+            storage_resource.download_raw("some/key.grib", local_path)
+            storage_resource.upload_raw("some/key.grib", local_path)
+
+        mock_boto3.assert_called_once()
+        mock_client = mock_boto3.return_value
+        mock_client.download_file.assert_called_once()
+        mock_client.upload_file.assert_called_once()
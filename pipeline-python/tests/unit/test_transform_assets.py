@@ -5,9 +5,11 @@ Transform assets can't use dg.materialize() because they read upstream metadata
 via instance.get_event_records(). Instead we use direct invocation with
 dg.build_asset_context() + instance.report_runless_asset_event().
 """
+import os
 import shutil
 import uuid
 from pathlib import Path
+from typing import NamedTuple
 
 import dagster as dg
 import numpy as np
@@ -23,6 +25,7 @@ from pipeline_python.defs.assets import (
     _EUROPE_LON_MAX,
 )
 from pipeline_python.defs.models import CuratedDataRecord
+from pipeline_python.storage import ObjectStore
 from pipeline_python.storage.grid_store import GridStore, GridData
 
 
@@ -49,25 +52,45 @@ ECMWF_PARTITION = "2026-03-16"
 # ---------------------------------------------------------------------------
 
 _grid_inserts: list[GridData] = []
+_grid_batches: list[int] = []
+_write_order: list[tuple[str, int]] = []  # ("lineage" | "grids", batch size) per flush, in call order
 _curated_inserts: list[CuratedDataRecord] = []
 _download_calls: list[dict] = []
 
 
+class _TransformRun(NamedTuple):
+    """Outcome of one transform invocation, snapshotted from the mock tracking lists."""
+
+    result: dg.MaterializeResult
+    grids: list[GridData]
+    curated: list[CuratedDataRecord]
+
+
 # ---------------------------------------------------------------------------
 # Mock resources
 # ---------------------------------------------------------------------------
 
 
 class MockGridStore(GridStore):
-    """Records GridData inserts and returns row_count."""
+    """Records GridData inserts (and the size of each insert_grids batch) and returns row_count."""
+
+    fail_on_batch: int = 0  # 1-based insert_grids call that raises; 0 never fails
 
     def insert_grid(self, grid: GridData) -> int:
         _grid_inserts.append(grid)
         return grid.row_count
 
+    def insert_grids(self, grids) -> int:
+        grids = list(grids)
+        _grid_batches.append(len(grids))
+        _write_order.append(("grids", len(grids)))
+        if len(_grid_batches) == self.fail_on_batch:
+            raise RuntimeError("Mock grid store failure")
+        return super().insert_grids(grids)
+
 
-class MockObjectStore(dg.ConfigurableResource):
-    """Copies the fixture file on download_raw()."""
+class MockObjectStore(ObjectStore):
+    """Hard-links (or, across filesystems, copies) the fixture file on download_raw()."""
 
     fixture_path: str
     should_fail: bool = False
@@ -76,7 +99,11 @@ class MockObjectStore(dg.ConfigurableResource):
         _download_calls.append({"key": key, "local_path": local_path})
         if self.should_fail:
             raise FileNotFoundError(f"Mock download failure: {key}")
-        shutil.copy2(self.fixture_path, local_path)
+        local_path.unlink(missing_ok=True)  # scoped_tempfile pre-creates the file
+        try:
+            os.link(self.fixture_path, local_path)
+        except OSError:
+            shutil.copy2(self.fixture_path, local_path)
 
 
 class MockCatalogResource(dg.ConfigurableResource):
@@ -89,6 +116,12 @@ class MockCatalogResource(dg.ConfigurableResource):
         if self.should_fail:
             raise Exception("Mock catalog failure")
 
+    def insert_curated_records(self, records) -> None:
+        records = list(records)
+        _write_order.append(("lineage", len(records)))
+        for record in records:
+            self.insert_curated_data(record)
+
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -98,8 +131,10 @@ class MockCatalogResource(dg.ConfigurableResource):
 @pytest.fixture(autouse=True)
 def _reset_mock_state():
     """Reset all module-level mock state before each test."""
-    global _grid_inserts, _curated_inserts, _download_calls
+    global _grid_inserts, _grid_batches, _write_order, _curated_inserts, _download_calls
     _grid_inserts = []
+    _grid_batches = []
+    _write_order = []
     _curated_inserts = []
     _download_calls = []
 
@@ -132,49 +167,61 @@ def _report_ecmwf_upstream(instance: dg.DagsterInstance) -> None:
 class TestTransformCamsDataUnit:
     """Unit tests for transform_cams_data using mocked resources."""
 
-    def _run(self, object_store=None, catalog=None, grid_store=None):
+    def _run(self, object_store_settings, object_store=None, catalog=None, grid_store=None):
         instance = dg.DagsterInstance.ephemeral()
         _report_cams_upstream(instance)
         context = dg.build_asset_context(instance=instance, partition_key=CAMS_PARTITION)
         return transform_cams_data(
             context,
-            object_store or MockObjectStore(fixture_path=str(CAMS_FIXTURE)),
+            object_store or MockObjectStore(**object_store_settings, fixture_path=str(CAMS_FIXTURE)),
             catalog or MockCatalogResource(),
             grid_store or MockGridStore(),
         )
 
-    def test_converts_kg_m3_to_ug_m3(self):
+    @pytest.fixture(scope="class")
+    def transformed(self, object_store_settings) -> _TransformRun:
+        """Decode the fixture GRIB once per class; happy-path tests only read the outcome."""
+        _grid_inserts.clear()
+        _curated_inserts.clear()
+        result = self._run(object_store_settings)
+        return _TransformRun(result, list(_grid_inserts), list(_curated_inserts))
+
+    def test_converts_kg_m3_to_ug_m3(self, transformed):
         """CAMS raw unit is kg m-3; transform should convert to micrograms."""
-        self._run()
-        for grid in _grid_inserts:
+        for grid in transformed.grids:
             assert grid.unit == "µg/m³"
 
-    def test_records_curated_lineage_per_message(self):
+    def test_records_curated_lineage_per_message(self, transformed):
         """8 curated inserts expected (2 variables x 4 timestamps)."""
-        self._run()
-        assert len(_curated_inserts) == 8
+        assert len(transformed.curated) == 8
 
-    def test_variables_processed_is_dynamic(self):
+    def test_every_grid_has_curated_lineage(self, transformed):
+        """Each inserted grid's catalog_id should match exactly one curated record."""
+        assert sorted(g.catalog_id for g in transformed.grids) == sorted(r.id for r in transformed.curated)
+
+    def test_variables_processed_is_dynamic(self, transformed):
         """Metadata variables_processed should reflect actual GRIB content."""
-        result = self._run()
-        assert set(result.metadata["variables_processed"]) == {"pm2p5", "pm10"}
+        assert set(transformed.result.metadata["variables_processed"]) == {"pm2p5", "pm10"}
 
-    def test_fails_without_upstream(self):
+    def test_fails_without_upstream(self, object_store_settings):
         """Should raise dg.Failure when no upstream materialization exists."""
         instance = dg.DagsterInstance.ephemeral()
         context = dg.build_asset_context(instance=instance, partition_key=CAMS_PARTITION)
         with pytest.raises(dg.Failure):
             transform_cams_data(
                 context,
-                MockObjectStore(fixture_path=str(CAMS_FIXTURE)),
+                MockObjectStore(**object_store_settings, fixture_path=str(CAMS_FIXTURE)),
                 MockCatalogResource(),
                 MockGridStore(),
             )
 
-    def test_fails_on_download_error(self):
+    def test_fails_on_download_error(self, object_store_settings):
         """Should raise dg.Failure with 'Failed to download' on download error."""
         with pytest.raises(dg.Failure, match="Failed to download"):
-            self._run(object_store=MockObjectStore(fixture_path=str(CAMS_FIXTURE), should_fail=True))
+            self._run(
+                object_store_settings,
+                object_store=MockObjectStore(**object_store_settings, fixture_path=str(CAMS_FIXTURE), should_fail=True),
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -185,89 +232,117 @@ class TestTransformCamsDataUnit:
 class TestTransformEcmwfDataUnit:
     """Unit tests for transform_ecmwf_data using mocked resources."""
 
-    def _run(self, object_store=None, catalog=None, grid_store=None):
+    def _run(self, object_store_settings, object_store=None, catalog=None, grid_store=None):
         instance = dg.DagsterInstance.ephemeral()
         _report_ecmwf_upstream(instance)
         context = dg.build_asset_context(instance=instance, partition_key=ECMWF_PARTITION)
         return transform_ecmwf_data(
             context,
-            object_store or MockObjectStore(fixture_path=str(ECMWF_FIXTURE)),
+            object_store or MockObjectStore(**object_store_settings, fixture_path=str(ECMWF_FIXTURE)),
             catalog or MockCatalogResource(),
             grid_store or MockGridStore(),
         )
 
-    def test_inserts_temperature_dewpoint_and_humidity(self):
+    @pytest.fixture(scope="class")
+    def transformed(self, object_store_settings) -> _TransformRun:
+        """Decode the fixture GRIB once per class; happy-path tests only read the outcome."""
+        _grid_inserts.clear()
+        _curated_inserts.clear()
+        result = self._run(object_store_settings)
+        return _TransformRun(result, list(_grid_inserts), list(_curated_inserts))
+
+    def test_inserts_temperature_dewpoint_and_humidity(self, transformed):
         """Grid inserts should include temperature, dewpoint, and humidity."""
-        self._run()
-        variables = {g.variable for g in _grid_inserts}
+        variables = {g.variable for g in transformed.grids}
         assert variables == {"temperature", "dewpoint", "humidity"}
 
-    def test_temperature_converted_to_celsius(self):
+    def test_temperature_converted_to_celsius(self, transformed):
         """Temperature values should be in Celsius, not Kelvin."""
-        self._run()
-        for grid in _grid_inserts:
+        for grid in transformed.grids:
             if grid.variable == "temperature":
                 assert grid.unit == "°C"
                 # Celsius range: roughly -65 to +55 for Earth
                 assert grid.values.min() > -80
                 assert grid.values.max() < 60
 
-    def test_dewpoint_converted_to_celsius(self):
+    def test_dewpoint_converted_to_celsius(self, transformed):
         """Dewpoint values should be in Celsius, not Kelvin."""
-        self._run()
-        dewpoint_grids = [g for g in _grid_inserts if g.variable == "dewpoint"]
+        dewpoint_grids = [g for g in transformed.grids if g.variable == "dewpoint"]
         assert dewpoint_grids, "Expected at least one dewpoint grid to be inserted"
         for grid in dewpoint_grids:
             assert grid.unit == "°C"
             assert grid.values.min() > -80
             assert grid.values.max() < 60
 
-    def test_humidity_computed_as_percentage(self):
+    def test_humidity_computed_as_percentage(self, transformed):
         """Humidity values should be percentage (0-~105)."""
-        self._run()
-        for grid in _grid_inserts:
+        for grid in transformed.grids:
             if grid.variable == "humidity":
                 assert grid.unit == "%"
                 assert grid.values.min() >= 0
                 assert grid.values.max() <= 105
 
-    def test_grid_clipped_to_europe(self):
+    def test_grid_clipped_to_europe(self, transformed):
         """All lat/lon values should be within the European bounding box, shape 169x281."""
-        self._run()
-        for grid in _grid_inserts:
+        for grid in transformed.grids:
             assert grid.values.shape == (169, 281)
             assert grid.lats.min() >= _EUROPE_LAT_MIN
             assert grid.lats.max() <= _EUROPE_LAT_MAX
             assert grid.lons.min() >= _EUROPE_LON_MIN
             assert grid.lons.max() <= _EUROPE_LON_MAX
 
-    def test_records_curated_lineage(self):
+    def test_records_curated_lineage(self, transformed):
         """6 curated inserts expected (3 variables x 2 timestamps)."""
-        self._run()
-        assert len(_curated_inserts) == 6
+        assert len(transformed.curated) == 6
 
-    def test_inserted_rows_metadata_matches_actual(self):
+    def test_inserted_rows_metadata_matches_actual(self, transformed):
         """Metadata inserted_rows should match sum of grid row counts."""
-        result = self._run()
-        expected = sum(g.row_count for g in _grid_inserts)
-        assert result.metadata["inserted_rows"] == expected
+        expected = sum(g.row_count for g in transformed.grids)
+        assert transformed.result.metadata["inserted_rows"] == expected
+
+    def test_flushes_grids_in_bounded_batches(self, object_store_settings):
+        """Grids should reach the store in batches within insert_batch_rows."""
+        # Budget fits exactly one timestamp's temperature/dewpoint/humidity grids
+        result = self._run(object_store_settings, grid_store=MockGridStore(insert_batch_rows=3 * 169 * 281))
+
+        assert _grid_batches == [3, 3]
+        assert result.metadata["inserted_rows"] == sum(g.row_count for g in _grid_inserts)
+
+    def test_writes_lineage_per_batch_before_grids(self, object_store_settings):
+        """Each flush should write exactly its own batch's lineage, then that batch's grids."""
+        self._run(object_store_settings, grid_store=MockGridStore(insert_batch_rows=3 * 169 * 281))
 
-    def test_fails_without_upstream(self):
+        assert _write_order == [("lineage", 3), ("grids", 3), ("lineage", 3), ("grids", 3)]
+
+    def test_flushed_grids_keep_lineage_when_later_batch_fails(self, object_store_settings):
+        """Every grid already in the store must have its curated lineage, even if a later batch fails."""
+        with pytest.raises(Exception):
+            self._run(object_store_settings, grid_store=MockGridStore(insert_batch_rows=3 * 169 * 281, fail_on_batch=2))
+
+        assert _grid_batches == [3, 3]
+        assert len(_grid_inserts) == 3
+        curated_ids = {record.id for record in _curated_inserts}
+        assert all(grid.catalog_id in curated_ids for grid in _grid_inserts)
+
+    def test_fails_without_upstream(self, object_store_settings):
         """Should raise dg.Failure when no upstream materialization exists."""
         instance = dg.DagsterInstance.ephemeral()
         context = dg.build_asset_context(instance=instance, partition_key=ECMWF_PARTITION)
         with pytest.raises(dg.Failure):
             transform_ecmwf_data(
                 context,
-                MockObjectStore(fixture_path=str(ECMWF_FIXTURE)),
+                MockObjectStore(**object_store_settings, fixture_path=str(ECMWF_FIXTURE)),
                 MockCatalogResource(),
                 MockGridStore(),
             )
 
-    def test_fails_on_download_error(self):
+    def test_fails_on_download_error(self, object_store_settings):
         """Should raise dg.Failure with 'Failed to download' on download error."""
         with pytest.raises(dg.Failure, match="Failed to download"):
-            self._run(object_store=MockObjectStore(fixture_path=str(ECMWF_FIXTURE), should_fail=True))
+            self._run(
+                object_store_settings,
+                object_store=MockObjectStore(**object_store_settings, fixture_path=str(ECMWF_FIXTURE), should_fail=True),
+            )
 
 
 # ---------------------------------------------------------------------------